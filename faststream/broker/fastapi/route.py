@@ -234,7 +234,7 @@ def make_fastapi_execution(
                 **kwargs,
             )
 
-            raw_message.background = solved_result.background_tasks  # type: ignore[attr-defined]
+            raw_message.background = solved_result.background_tasks
 
             if solved_result.errors:
                 raise_fastapi_validation_error(solved_result.errors, request._body)  # type: ignore[arg-type]
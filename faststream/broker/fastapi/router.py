@@ -3,6 +3,7 @@ import warnings
 from abc import abstractmethod
 from contextlib import asynccontextmanager
 from enum import Enum
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,9 +17,9 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
-    cast,
     overload,
 )
 
@@ -26,9 +27,11 @@ from fastapi.datastructures import Default
 from fastapi.responses import HTMLResponse
 from fastapi.routing import APIRoute, APIRouter
 from fastapi.utils import generate_unique_id
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse, Response
 from starlette.routing import BaseRoute, _DefaultLifespan
 
+from faststream._compat import orjson
 from faststream.asyncapi.proto import AsyncAPIApplication
 from faststream.asyncapi.site import get_asyncapi_html
 from faststream.broker.middlewares import BaseMiddleware
@@ -38,8 +41,9 @@ from faststream.broker.types import (
     P_HandlerParams,
     T_HandlerReturn,
 )
+from faststream.exceptions import INSTALL_YAML
 from faststream.utils.context.repository import context
-from faststream.utils.functions import fake_context, to_async
+from faststream.utils.functions import ensure_async, fake_context
 
 from .config import FastAPIConfig
 from .get_dependant import get_fastapi_dependant
@@ -49,7 +53,6 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from fastapi import FastAPI, params
-    from fastapi.background import BackgroundTasks
     from fastapi.types import IncEx
     from starlette import routing
     from starlette.types import ASGIApp, AppType, Lifespan
@@ -65,6 +68,13 @@ if TYPE_CHECKING:
     from faststream.types import AnyDict
 
 
+def _dump_schema_json(schema: "Schema") -> bytes:
+    if orjson is not None:
+        return orjson.dumps(schema.to_jsonable(), option=orjson.OPT_INDENT_2)  # type: ignore[no-any-return]
+
+    return json.dumps(schema.to_jsonable(), indent=2).encode()
+
+
 class _BackgroundMiddleware(BaseMiddleware):
     async def __aexit__(
         self,
@@ -72,13 +82,10 @@ class _BackgroundMiddleware(BaseMiddleware):
         exc_val: Optional[BaseException] = None,
         exc_tb: Optional["TracebackType"] = None,
     ) -> Optional[bool]:
-        if not exc_type and (
-            background := cast(
-                "Optional[BackgroundTasks]",
-                getattr(context.get_local("message"), "background", None),
-            )
-        ):
-            await background()
+        if exc_type is None:
+            background = getattr(context.get_local("message"), "background", None)
+            if background is not None:
+                await background()
 
         return await super().after_processed(exc_type, exc_val, exc_tb)
 
@@ -95,7 +102,11 @@ class StreamRouter(
     docs_router: Optional[APIRouter]
     _after_startup_hooks: List[Callable[[Any], Awaitable[Optional[Mapping[str, Any]]]]]
     _on_shutdown_hooks: List[Callable[[Any], Awaitable[None]]]
+    _dependencies: Tuple["params.Depends", ...]
     schema: Optional["Schema"]
+    _schema_json: Optional[bytes]
+    _schema_yaml: Optional[bytes]
+    _html_cache: Dict[Tuple[bool, ...], bytes]
 
     title: str
     description: str
@@ -167,6 +178,10 @@ class StreamRouter(
         self.contact = None
 
         self.schema = None
+        # Serialized schema cache, filled at lifespan startup
+        self._schema_json = None
+        self._schema_yaml = None
+        self._html_cache = {}
         # Flag to prevent double lifespan start
         self._lifespan_started = False
 
@@ -190,6 +205,9 @@ class StreamRouter(
             on_shutdown=on_shutdown,
         )
 
+        # Router-level dependencies are shared by all subscribers
+        self._dependencies = tuple(self.dependencies)
+
         self.fastapi_config = FastAPIConfig(
             dependency_overrides_provider=dependency_overrides_provider
         )
@@ -217,25 +235,45 @@ class StreamRouter(
         Callable[["StreamMessage[Any]"], Awaitable[Any]],
     ]:
         """Decorator before `broker.subscriber`, that wraps function to FastAPI-compatible one."""
+        return partial(
+            self._wrap_endpoint,
+            dependencies=dependencies,
+            response_model=response_model,
+            response_model_include=response_model_include,
+            response_model_exclude=response_model_exclude,
+            response_model_by_alias=response_model_by_alias,
+            response_model_exclude_unset=response_model_exclude_unset,
+            response_model_exclude_defaults=response_model_exclude_defaults,
+            response_model_exclude_none=response_model_exclude_none,
+        )
 
-        def wrapper(
-            endpoint: Callable[..., Any],
-        ) -> Callable[["StreamMessage[Any]"], Awaitable[Any]]:
-            """Patch user function to make it FastAPI-compatible."""
-            return wrap_callable_to_fastapi_compatible(
-                user_callable=endpoint,
-                dependencies=dependencies,
-                response_model=response_model,
-                response_model_include=response_model_include,
-                response_model_exclude=response_model_exclude,
-                response_model_by_alias=response_model_by_alias,
-                response_model_exclude_unset=response_model_exclude_unset,
-                response_model_exclude_defaults=response_model_exclude_defaults,
-                response_model_exclude_none=response_model_exclude_none,
-                fastapi_config=self.fastapi_config,
-            )
-
-        return wrapper
+    def _wrap_endpoint(
+        self,
+        endpoint: Callable[..., Any],
+        *,
+        dependencies: Iterable["params.Depends"],
+        response_model: Any,
+        response_model_include: Optional["IncEx"],
+        response_model_exclude: Optional["IncEx"],
+        response_model_by_alias: bool,
+        response_model_exclude_unset: bool,
+        response_model_exclude_defaults: bool,
+        response_model_exclude_none: bool,
+    ) -> Callable[["StreamMessage[Any]"], Awaitable[Any]]:
+        """Patch user function to make it FastAPI-compatible."""
+        # config is resolved at call time: `include_router` may replace it
+        return wrap_callable_to_fastapi_compatible(
+            user_callable=endpoint,
+            dependencies=dependencies,
+            response_model=response_model,
+            response_model_include=response_model_include,
+            response_model_exclude=response_model_exclude,
+            response_model_by_alias=response_model_by_alias,
+            response_model_exclude_unset=response_model_exclude_unset,
+            response_model_exclude_defaults=response_model_exclude_defaults,
+            response_model_exclude_none=response_model_exclude_none,
+            fastapi_config=self.fastapi_config,
+        )
 
     def subscriber(
         self,
@@ -254,7 +292,10 @@ class StreamRouter(
         "HandlerCallWrapper[MsgType, P_HandlerParams, T_HandlerReturn]",
     ]:
         """A function decorator for subscribing to a message queue."""
-        dependencies = (*self.dependencies, *dependencies)
+        if dependencies:
+            dependencies = self._dependencies + tuple(dependencies)
+        else:
+            dependencies = self._dependencies
 
         sub = self.broker.subscriber(  # type: ignore[call-arg]
             *extra,  # type: ignore[arg-type]
@@ -299,16 +340,21 @@ class StreamRouter(
                 from faststream.asyncapi.generate import get_app_schema
 
                 self.schema = get_app_schema(self)
+                self._schema_json = _dump_schema_json(self.schema)
+                try:
+                    self._schema_yaml = self.schema.to_yaml().encode()
+                except ImportError:
+                    # PyYAML is optional, so endpoint raises install hint instead
+                    self._schema_yaml = None
+                self._html_cache.clear()
 
                 app.include_router(self.docs_router)
 
             async with lifespan_context(app) as maybe_context:
                 if maybe_context is None:
-                    context: AnyDict = {}
+                    context: AnyDict = {"broker": self.broker}
                 else:
-                    context = dict(maybe_context)
-
-                context.update({"broker": self.broker})
+                    context = {**maybe_context, "broker": self.broker}
 
                 if not self._lifespan_started:
                     await self.broker.start()
@@ -378,7 +424,7 @@ class StreamRouter(
         Callable[["AppType"], Awaitable[None]],
     ]:
         """Register a function to be executed after startup."""
-        self._after_startup_hooks.append(to_async(func))
+        self._after_startup_hooks.append(ensure_async(func))
         return func
 
     @overload
@@ -404,7 +450,7 @@ class StreamRouter(
         Callable[["AppType"], Awaitable[None]],
     ]:
         """Register a function to be executed before broker stop."""
-        self._on_shutdown_hooks.append(to_async(func))
+        self._on_shutdown_hooks.append(ensure_async(func))
         return func
 
     @abstractmethod
@@ -417,29 +463,30 @@ class StreamRouter(
         if not self.include_in_schema or not schema_url:
             return None
 
-        def download_app_json_schema() -> Response:
+        async def download_app_json_schema() -> Response:
             assert (  # nosec B101
-                self.schema
+                self._schema_json
             ), "You need to run application lifespan at first"
 
             return Response(
-                content=json.dumps(self.schema.to_jsonable(), indent=2),
-                headers={"Content-Type": "application/octet-stream"},
+                content=self._schema_json,
+                media_type="application/octet-stream",
             )
 
-        def download_app_yaml_schema() -> Response:
+        async def download_app_yaml_schema() -> Response:
             assert (  # nosec B101
                 self.schema
             ), "You need to run application lifespan at first"
 
+            if self._schema_yaml is None:
+                raise ImportError(INSTALL_YAML)
+
             return Response(
-                content=self.schema.to_yaml(),
-                headers={
-                    "Content-Type": "application/octet-stream",
-                },
+                content=self._schema_yaml,
+                media_type="application/octet-stream",
             )
 
-        def serve_asyncapi_schema(
+        async def serve_asyncapi_schema(
             sidebar: bool = True,
             info: bool = True,
             servers: bool = True,
@@ -454,8 +501,22 @@ class StreamRouter(
                 self.schema
             ), "You need to run application lifespan at first"
 
-            return HTMLResponse(
-                content=get_asyncapi_html(
+            key = (
+                sidebar,
+                info,
+                servers,
+                operations,
+                messages,
+                schemas,
+                errors,
+                expandMessageExamples,
+            )
+
+            # flags combinations are bounded, so cache is limited by 256 entries
+            if (content := self._html_cache.get(key)) is None:
+                # render is CPU-bound, so keep it out of the event loop
+                html = await run_in_threadpool(
+                    get_asyncapi_html,
                     self.schema,
                     sidebar=sidebar,
                     info=info,
@@ -467,18 +528,25 @@ class StreamRouter(
                     expand_message_examples=expandMessageExamples,
                     title=self.schema.info.title,
                 )
-            )
+                content = self._html_cache[key] = html.encode()
+
+            return HTMLResponse(content=content)
 
         docs_router = APIRouter(
             prefix=self.prefix,
-            tags=["asyncapi"],
             redirect_slashes=self.redirect_slashes,
             default=self.default,
             deprecated=self.deprecated,
+            # AsyncAPI documentation endpoints are not a part of OpenAPI schema
+            include_in_schema=False,
         )
-        docs_router.get(schema_url)(serve_asyncapi_schema)
-        docs_router.get(f"{schema_url}.json")(download_app_json_schema)
-        docs_router.get(f"{schema_url}.yaml")(download_app_yaml_schema)
+        for path, endpoint in (
+            (schema_url, serve_asyncapi_schema),
+            (f"{schema_url}.json", download_app_json_schema),
+            (f"{schema_url}.yaml", download_app_yaml_schema),
+        ):
+            docs_router.add_api_route(path, endpoint, methods=["GET"])
+
         return docs_router
 
     def include_router(  # type: ignore[override]
@@ -499,19 +567,21 @@ class StreamRouter(
     ) -> None:
         """Includes a router in the API."""
         if isinstance(router, BrokerRouter):
+            call_decorators = (
+                self._add_api_mq_route(
+                    dependencies=(),
+                    response_model=Default(None),
+                    response_model_include=None,
+                    response_model_exclude=None,
+                    response_model_by_alias=True,
+                    response_model_exclude_unset=False,
+                    response_model_exclude_defaults=False,
+                    response_model_exclude_none=False,
+                ),
+            )
+
             for sub in router._subscribers.values():
-                sub._call_decorators = (  # type: ignore[attr-defined]
-                    self._add_api_mq_route(
-                        dependencies=(),
-                        response_model=Default(None),
-                        response_model_include=None,
-                        response_model_exclude=None,
-                        response_model_by_alias=True,
-                        response_model_exclude_unset=False,
-                        response_model_exclude_defaults=False,
-                        response_model_exclude_none=False,
-                    ),
-                )
+                sub._call_decorators = call_decorators  # type: ignore[attr-defined]
 
             self.broker.include_router(router)
             return
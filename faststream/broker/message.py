@@ -5,6 +5,8 @@ from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
+    Callable,
     Generic,
     List,
     Optional,
@@ -71,6 +73,11 @@ class StreamMessage(Generic[MsgType]):
     _source_type: SourceType = field(default=SourceType.Consume)
     _decoded_body: Optional["DecodedMessage"] = field(default=None, init=False)
 
+    background: Optional[Callable[[], Awaitable[None]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Background tasks to run after processing (set by FastAPI integration)."""
+
     async def ack(self) -> None:
         if not self.committed:
             self.committed = AckStatus.acked
@@ -53,7 +53,7 @@ def serve(
 ) -> None:
     """Serve project AsyncAPI schema."""
     if ":" in app:
-        if app_dir:  # pragma: no branch
+        if app_dir and app_dir not in sys.path:  # pragma: no branch
             sys.path.insert(0, app_dir)
 
         module, _ = import_from_string(app, is_factory=is_factory)
@@ -118,7 +118,7 @@ def gen(
     ),
 ) -> None:
     """Generate project AsyncAPI schema."""
-    if app_dir:  # pragma: no branch
+    if app_dir and app_dir not in sys.path:  # pragma: no branch
         sys.path.insert(0, app_dir)
 
     _, app_obj = import_from_string(app, is_factory=is_factory)
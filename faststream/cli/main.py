@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import sys
 import warnings
@@ -15,7 +16,7 @@ from faststream.__about__ import __version__
 from faststream._internal.application import Application
 from faststream.asgi.app import AsgiFastStream
 from faststream.cli.docs.app import docs_app
-from faststream.cli.utils.imports import import_from_string
+from faststream.cli.utils.imports import get_module_path, import_from_string
 from faststream.cli.utils.logs import (
     LogFiles,
     LogLevels,
@@ -126,12 +127,9 @@ def run(
     app, extra = parse_cli_args(app, *ctx.args)
     casted_log_level = get_log_level(log_level)
 
-    if app_dir:  # pragma: no branch
+    if app_dir and app_dir not in sys.path:  # pragma: no branch
         sys.path.insert(0, app_dir)
 
-    # Should be imported after sys.path changes
-    module_path, app_obj = import_from_string(app, is_factory=is_factory)
-
     args = (app, extra, is_factory, log_config, casted_log_level)
 
     if reload and workers > 1:
@@ -145,6 +143,9 @@ def run(
             _run(*args)
 
         else:
+            # Application is imported by the reloader target process only
+            module_path = get_module_path(app)
+
             if app_dir != ".":
                 reload_dirs = [str(module_path), app_dir]
             else:
@@ -157,7 +158,12 @@ def run(
                 extra_extensions=watch_extensions,
             ).run()
 
-    elif workers > 1:
+        return
+
+    # Should be imported after sys.path changes
+    _, app_obj = import_from_string(app, is_factory=is_factory)
+
+    if workers > 1:
         if isinstance(app_obj, FastStream):
             from faststream.cli.supervisors.multiprocess import Multiprocess
 
@@ -233,11 +239,9 @@ def _run_imported_app(
             uvloop.install()
 
     try:
-        anyio.run(
-            app_obj.run,
-            app_level,
-            extra_options,
-        )
+        # app always runs on asyncio (uvloop policy if installed),
+        # so anyio backend-agnostic runner layer is redundant here
+        asyncio.run(app_obj.run(app_level, extra_options))
 
     except ValidationError as e:
         ex = MissingParameter(
@@ -1,5 +1,5 @@
 import importlib
-from importlib.util import module_from_spec, spec_from_file_location
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
 from pathlib import Path
 from typing import Tuple
 
@@ -84,17 +84,43 @@ def import_from_string(
     return module_path, instance
 
 
-def _import_obj_or_factory(import_str: str) -> Tuple[Path, "Application"]:
-    """Import FastStream application from module specified by a string."""
-    if not isinstance(import_str, str):
-        raise typer.BadParameter("Given value is not of type string")
+def get_module_path(import_str: str) -> Path:
+    """Get the application module directory.
+
+    The module itself is not executed, but its parent packages are imported.
+    """
+    module_str, _ = _split_import_string(import_str)
+
+    try:
+        spec = find_spec(module_str)
+    except (ImportError, ValueError):
+        spec = None
+
+    if spec is None or not spec.has_location or spec.origin is None:
+        module_path, _ = get_app_path(import_str)
+        return module_path
+
+    return Path(spec.origin).resolve().parent
 
+
+def _split_import_string(import_str: str) -> Tuple[str, str]:
+    """Split `<module>:<attribute>` import string to its parts."""
     module_str, _, attrs_str = import_str.partition(":")
     if not module_str or not attrs_str:
         raise typer.BadParameter(
             f'Import string "{import_str}" must be in format "<module>:<attribute>"'
         )
 
+    return module_str, attrs_str
+
+
+def _import_obj_or_factory(import_str: str) -> Tuple[Path, "Application"]:
+    """Import FastStream application from module specified by a string."""
+    if not isinstance(import_str, str):
+        raise typer.BadParameter("Given value is not of type string")
+
+    module_str, attrs_str = _split_import_string(import_str)
+
     try:
         module = importlib.import_module(  # nosemgrep: python.lang.security.audit.non-literal-import.non-literal-import
             module_str
@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
+from inspect import iscoroutinefunction
 from typing import (
     Any,
     AsyncIterator,
@@ -21,6 +22,7 @@ from faststream.types import F_Return, F_Spec
 __all__ = (
     "call_or_await",
     "drop_response_type",
+    "ensure_async",
     "fake_context",
     "timeout_scope",
     "to_async",
@@ -55,6 +57,31 @@ def to_async(
     return to_async_wrapper
 
 
+@overload
+def ensure_async(
+    func: Callable[F_Spec, Awaitable[F_Return]],
+) -> Callable[F_Spec, Awaitable[F_Return]]: ...
+
+
+@overload
+def ensure_async(
+    func: Callable[F_Spec, F_Return],
+) -> Callable[F_Spec, Awaitable[F_Return]]: ...
+
+
+def ensure_async(
+    func: Union[
+        Callable[F_Spec, F_Return],
+        Callable[F_Spec, Awaitable[F_Return]],
+    ],
+) -> Callable[F_Spec, Awaitable[F_Return]]:
+    """Converts a function to an asynchronous one, keeping coroutine functions as is."""
+    if iscoroutinefunction(func):
+        return func
+
+    return to_async(func)
+
+
 def timeout_scope(
     timeout: Optional[float] = 30,
     raise_timeout: bool = False,
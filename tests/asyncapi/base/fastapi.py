@@ -93,6 +93,100 @@ class FastAPITestCase:
                 response_html = client.get("/asyncapi_schema")
                 assert response_html.status_code == 200
 
+                openapi_paths = client.get("/openapi.json").json()["paths"]
+                assert "/asyncapi_schema" not in openapi_paths
+                assert "/asyncapi_schema.json" not in openapi_paths
+                assert "/asyncapi_schema.yaml" not in openapi_paths
+
+    @pytest.mark.asyncio
+    async def test_fastapi_asyncapi_json_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("faststream.broker.fastapi.router.orjson", None)
+
+        broker = self.broker_class(schema_url="/asyncapi_schema")
+
+        app = FastAPI(title="Тестовое приложение", description="Описание ✓")
+        app.include_router(broker)
+
+        async with self.broker_wrapper(broker.broker):
+            with TestClient(app) as client:
+                schema = get_app_schema(broker)
+
+                response_json = client.get("/asyncapi_schema.json")
+                # stdlib json escapes non-ASCII symbols unlike orjson
+                assert response_json.content.isascii()
+                assert response_json.json() == schema.to_jsonable()
+                assert response_json.json()["info"]["title"] == "Тестовое приложение"
+                assert response_json.json()["info"]["description"] == "Описание ✓"
+
+    @pytest.mark.asyncio
+    # lifespan restart warns about manual `lifespan_context` usage
+    @pytest.mark.filterwarnings("ignore:Specifying 'lifespan_context':UserWarning")
+    async def test_fastapi_asyncapi_schema_cache(self):
+        broker = self.broker_class(schema_url="/asyncapi_schema")
+
+        app = FastAPI(title="First")
+        app.include_router(broker)
+
+        async with self.broker_wrapper(broker.broker):
+            with TestClient(app) as client:
+                schema_json = broker._schema_json
+                schema_yaml = broker._schema_yaml
+
+                response_json = client.get("/asyncapi_schema.json")
+                assert response_json.content == schema_json
+                assert response_json.json()["info"]["title"] == "First"
+
+                response_yaml = client.get("/asyncapi_schema.yaml")
+                assert response_yaml.content == schema_yaml
+
+            app.title = "Second"
+
+            with TestClient(app) as client:
+                assert broker._schema_json != schema_json
+                assert broker._schema_yaml != schema_yaml
+
+                response_json = client.get("/asyncapi_schema.json")
+                assert response_json.json()["info"]["title"] == "Second"
+
+                response_yaml = client.get("/asyncapi_schema.yaml")
+                assert response_yaml.content == broker._schema_yaml
+
+    @pytest.mark.asyncio
+    # lifespan restart warns about manual `lifespan_context` usage
+    @pytest.mark.filterwarnings("ignore:Specifying 'lifespan_context':UserWarning")
+    async def test_fastapi_asyncapi_html_cache(self):
+        broker = self.broker_class(schema_url="/asyncapi_schema")
+
+        app = FastAPI()
+        app.include_router(broker)
+
+        async with self.broker_wrapper(broker.broker):
+            with TestClient(app) as client:
+                assert len(broker._html_cache) == 0
+
+                response_html = client.get("/asyncapi_schema")
+                assert response_html.status_code == 200
+                assert len(broker._html_cache) == 1
+
+                response_cached = client.get("/asyncapi_schema")
+                assert response_cached.content == response_html.content
+                assert len(broker._html_cache) == 1
+
+                response_no_sidebar = client.get(
+                    "/asyncapi_schema", params={"sidebar": False}
+                )
+                assert response_no_sidebar.status_code == 200
+                assert response_no_sidebar.content != response_html.content
+                assert len(broker._html_cache) == 2
+
+            with TestClient(app) as client:
+                assert len(broker._html_cache) == 0
+
+                client.get("/asyncapi_schema")
+                assert len(broker._html_cache) == 1
+
     @pytest.mark.asyncio
     async def test_fastapi_asyncapi_not_fount(self):
         broker = self.broker_class(include_in_schema=False)
@@ -609,6 +609,12 @@ class FastAPILocalTestcase(BaseTestcaseConfig):
         async def test_shutdown_async(app):
             mock.async_shutdown_called()
 
+        # coroutine hooks are stored as is, sync ones are wrapped
+        assert router._after_startup_hooks[0] is not test_sync
+        assert router._after_startup_hooks[1] is test_async
+        assert router._on_shutdown_hooks[0] is not test_shutdown_sync
+        assert router._on_shutdown_hooks[1] is test_shutdown_async
+
         async with self.broker_test(router.broker), router.lifespan_context(app):
             pass
 
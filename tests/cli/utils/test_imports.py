@@ -4,7 +4,12 @@ import pytest
 from typer import BadParameter
 
 from faststream.app import FastStream
-from faststream.cli.utils.imports import get_app_path, import_from_string, import_object
+from faststream.cli.utils.imports import (
+    get_app_path,
+    get_module_path,
+    import_from_string,
+    import_object,
+)
 from tests.marks import require_aiokafka, require_aiopika, require_nats
 
 
@@ -96,3 +101,20 @@ def test_import_module(test_input, exp_module):
 def test_import_from_string_wrong():
     with pytest.raises(BadParameter):
         import_from_string("module.app")
+
+
+@pytest.mark.parametrize(
+    ("test_input", "exp_module"),
+    (  # noqa: PT007
+        pytest.param("tests.marks:app", "tests", id="module"),
+        pytest.param("tests.cli:app", "tests/cli", id="package"),
+        pytest.param("not_exists.module:app", "not_exists/module", id="not found"),
+    ),
+)
+def test_get_module_path(test_input, exp_module):
+    assert get_module_path(test_input) == Path.cwd() / exp_module
+
+
+def test_get_module_path_wrong():
+    with pytest.raises(BadParameter):
+        get_module_path("module.app")
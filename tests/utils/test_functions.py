@@ -1,6 +1,6 @@
 import pytest
 
-from faststream.utils.functions import call_or_await
+from faststream.utils.functions import call_or_await, ensure_async
 
 
 def sync_func(a):
@@ -19,3 +19,17 @@ async def test_call():
 @pytest.mark.asyncio
 async def test_await():
     assert (await call_or_await(async_func, a=3)) == 3
+
+
+@pytest.mark.asyncio
+async def test_ensure_async_sync():
+    func = ensure_async(sync_func)
+    assert func is not sync_func
+    assert (await func(a=3)) == 3
+
+
+@pytest.mark.asyncio
+async def test_ensure_async_coroutine():
+    func = ensure_async(async_func)
+    assert func is async_func
+    assert (await func(a=3)) == 3